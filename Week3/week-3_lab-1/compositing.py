@@ -0,0 +1,143 @@
+import numpy as np
+
+
+# Everything here works on interleaved uint8 BGRA buffers with 16-bit integer
+# math: a*b for two uint8 values is at most 255*255 = 65025, which fits in
+# uint16, and _div255 divides by 255 with rounding using shifts only.
+#
+# Images are processed in strips of STRIP_ROWS rows, so the uint16 work
+# buffers scale with the image width only (about 1.5 MB for 1920 wide),
+# not with the whole frame.
+STRIP_ROWS = 64
+
+
+def _div255(x, tmp):
+    """In-place round(x / 255) for uint16 x <= 65025 (tmp: scratch of the same shape)."""
+    x += 128
+    np.right_shift(x, 8, out=tmp)
+    x += tmp
+    x >>= 8
+
+
+def _scratch(width, buffers=None):
+    """Work arrays for one strip: two uint16 (rows, width, 3) and a uint8 (rows, width, 1).
+
+    Cut from `buffers` (a previous _scratch result) when it is wide enough.
+    """
+    if buffers is None or buffers[0].shape[1] < width:
+        return (np.empty((STRIP_ROWS, width, 3), dtype='uint16'),
+                np.empty((STRIP_ROWS, width, 3), dtype='uint16'),
+                np.empty((STRIP_ROWS, width, 1), dtype='uint8'))
+    return tuple(b[:, :width] for b in buffers)
+
+
+def _overlap(fg, bg, pos):
+    """Slices of fg and bg covered by fg placed with its top-left corner at pos=(x, y)."""
+    x, y = pos
+    x0, y0 = max(x, 0), max(y, 0)
+    x1 = min(x + fg.shape[1], bg.shape[1])
+    y1 = min(y + fg.shape[0], bg.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return None, None
+    return fg[y0 - y:y1 - y, x0 - x:x1 - x], bg[y0:y1, x0:x1]
+
+
+def premultiply(bgra, out=None):
+    """Multiply B, G, R by alpha / 255 (rounded), the premultiplied-alpha form.
+
+    Pass out=bgra to convert in place; apart from that only one strip of
+    uint16 scratch is allocated.  Premultiplied overlays blend with one
+    multiply per channel instead of two.
+    """
+    if bgra.dtype != np.uint8 or bgra.ndim != 3 or bgra.shape[2] != 4:
+        raise ValueError("premultiply expects a uint8 BGRA image")
+    if out is None:
+        out = bgra.copy()
+    elif out is not bgra:
+        out[...] = bgra
+
+    acc, tmp, _ = _scratch(out.shape[1])
+    for top in range(0, out.shape[0], STRIP_ROWS):
+        strip = out[top:top + STRIP_ROWS]
+        rows = strip.shape[0]
+        np.multiply(strip[..., :3], strip[..., 3:], out=acc[:rows], dtype='uint16')
+        _div255(acc[:rows], tmp[:rows])
+        np.copyto(strip[..., :3], acc[:rows], casting='unsafe')
+
+    return out
+
+
+def _blend_strip(fg, region, premultiplied, acc, tmp, inv_alpha):
+    """Blend one strip of fg onto the matching strip of bg, using the given scratch."""
+    alpha = fg[..., 3:]
+    np.subtract(255, alpha, out=inv_alpha)
+
+    np.multiply(region[..., :3], inv_alpha, out=acc, dtype='uint16')
+    if premultiplied:
+        # fg_p is an integer, so fg_p + round(bg * (255 - a) / 255) is already
+        # a single rounding of (fg_p * 255 + bg * (255 - a)) / 255.  Colours
+        # above alpha (not valid premultiplied data) would exceed 255: saturate.
+        _div255(acc, tmp)
+        acc += fg[..., :3]
+        np.minimum(acc, 255, out=acc)
+    else:
+        np.multiply(fg[..., :3], alpha, out=tmp, dtype='uint16')
+        acc += tmp
+        _div255(acc, tmp)
+    np.copyto(region[..., :3], acc, casting='unsafe')
+
+    if region.shape[2] == 4:
+        acc, tmp = acc[..., :1], tmp[..., :1]
+        np.multiply(region[..., 3:], inv_alpha, out=acc, dtype='uint16')
+        _div255(acc, tmp)
+        acc += alpha
+        np.copyto(region[..., 3:], acc, casting='unsafe')
+
+
+def alpha_blend(fg, bg, pos=(0, 0), premultiplied=False, _buffers=None):
+    """Draw the BGRA image `fg` over `bg` at pos=(x, y), in place (like cv2.rectangle).
+
+    bg may be BGR or BGRA; parts of fg outside bg are ignored.  Colours are
+    computed as round((fg * a + bg * (255 - a)) / 255) without converting to
+    float or splitting channels.
+
+    With premultiplied=True, fg must come from premultiply() and the result is
+    fg_p + round(bg * (255 - a) / 255).  Because fg_p was already rounded, this
+    can differ by 1 from the straight-alpha formula; colour values above alpha
+    saturate at 255.  A BGRA background gets its alpha updated with the "over"
+    rule, a + a_bg * (255 - a) / 255.  Returns bg.
+    """
+    if fg.dtype != np.uint8 or fg.ndim != 3 or fg.shape[2] != 4:
+        raise ValueError("foreground must be a uint8 BGRA image")
+    if bg.dtype != np.uint8 or bg.ndim != 3 or bg.shape[2] not in (3, 4):
+        raise ValueError("background must be a uint8 BGR or BGRA image")
+
+    fg, region = _overlap(fg, bg, pos)
+    if fg is None:
+        return bg
+
+    acc, tmp, inv_alpha = _scratch(fg.shape[1], _buffers)
+    for top in range(0, fg.shape[0], STRIP_ROWS):
+        rows = min(STRIP_ROWS, fg.shape[0] - top)
+        _blend_strip(fg[top:top + rows], region[top:top + rows], premultiplied,
+                     acc[:rows], tmp[:rows], inv_alpha[:rows])
+
+    return bg
+
+
+def composite_overlays(bg, overlays, premultiplied=False):
+    """Blend many (fg, (x, y)) overlays onto bg in order, in place.
+
+    One set of strip buffers, sized for the widest overlay, is allocated and
+    reused, so annotation jobs with hundreds of stickers/labels don't allocate
+    per overlay.  Returns bg.
+    """
+    overlays = list(overlays)
+    if not overlays:
+        return bg
+
+    buffers = _scratch(max(fg.shape[1] for fg, _ in overlays))
+    for fg, pos in overlays:
+        alpha_blend(fg, bg, pos, premultiplied, _buffers=buffers)
+
+    return bg
@@ -0,0 +1,173 @@
+import cv2
+import numpy as np
+
+from point_ops import gamma_lut
+
+
+# A batch is one stacked array of same-size images: (N, H, W, C) for colour or
+# (N, H, W) for grayscale.  Parameters (tables, rmin/rmax) are computed once
+# for the whole batch; the pixel work is one cv2.LUT pass per image, or per
+# batch when all images share a table.
+#
+# On small uint8 thumbnails the pixel pass is already close to memory speed,
+# so this removes the per-call table building and reductions but does NOT
+# reach a 10x speed-up: see bench_batch_ops.py (roughly 1.5-3.5x).
+
+
+def group_by_shape(images):
+    """Bucket images by (shape, dtype) and stack each bucket into a batch.
+
+    Returns a list of (indices, batch) pairs; indices are positions in
+    `images`, so results can be scattered back in the original order.
+    """
+    buckets = {}
+    for i, img in enumerate(images):
+        buckets.setdefault((img.shape, img.dtype), []).append(i)
+
+    # Copy each image straight into its preallocated bucket (no temporary list)
+    groups = []
+    for (shape, dtype), idx in buckets.items():
+        batch = np.empty((len(idx),) + shape, dtype=dtype)
+        for row, i in enumerate(idx):
+            batch[row] = images[i]
+        groups.append((idx, batch))
+
+    return groups
+
+
+def map_batched(images, fn, params=None):
+    """Run fn(batch, **params) once per shape bucket and return a list of results.
+
+    params maps a parameter name to one value per image (e.g. a gamma per
+    image); each bucket receives the matching subset as an array.  Stacking
+    copies every image once, which costs about as much as a uint8 LUT pass,
+    so for gamma on a list use gamma_correction_list instead.
+    """
+    params = {name: np.asarray(values) for name, values in (params or {}).items()}
+    for name, values in params.items():
+        if len(values) != len(images):
+            raise ValueError(f"{name} has {len(values)} values for {len(images)} images")
+
+    results = [None] * len(images)
+    for idx, batch in group_by_shape(images):
+        out = fn(batch, **{name: values[idx] for name, values in params.items()})
+        for i, result in zip(idx, out):
+            results[i] = result
+
+    return results
+
+
+def _per_image(value, n, name):
+    """A scalar or length-n sequence as a float64 array of shape (n,)."""
+    value = np.asarray(value, dtype='float64')
+    if value.ndim == 0:
+        return np.full(n, value)
+    if value.shape != (n,):
+        raise ValueError(f"{name} must be a scalar or have one value per image ({n})")
+    return value
+
+
+def gamma_correction_batch(c, gamma, batch):
+    """gamma_correction for a whole batch; gamma is a scalar or one value per image.
+
+    uint8 only (through lookup tables).  Results are identical to calling
+    gamma_correction on each image.
+    """
+    if batch.dtype != np.uint8:
+        raise ValueError("gamma_correction_batch expects a uint8 batch")
+
+    gammas = _per_image(gamma, batch.shape[0], "gamma")
+    if batch.shape[0] == 0:
+        return np.empty_like(batch)
+    unique, which = np.unique(gammas, return_inverse=True)
+    luts = [gamma_lut(c, float(g)) for g in unique]
+
+    if unique.size == 1:
+        return _lut_batch(batch, luts[0])
+
+    # Tables are built once per distinct gamma; each image is then one cv2.LUT
+    # pass straight into its slot of the output (no fancy-index copies)
+    out = np.empty_like(batch)
+    for i, k in enumerate(which):
+        cv2.LUT(batch[i], luts[k], dst=out[i])
+    return out
+
+
+def gamma_correction_list(c, gamma, images):
+    """gamma_correction for a list of uint8 images of any sizes, without stacking.
+
+    gamma is a scalar or one value per image.  The speed-up over calling
+    gamma_correction per image comes from building each distinct gamma's
+    table once; cv2.LUT already runs at close to memory speed per image.
+    """
+    gammas = _per_image(gamma, len(images), "gamma")
+    luts = {}
+    out = []
+    for g, img in zip(gammas, images):
+        if g not in luts:
+            luts[g] = gamma_lut(c, float(g))
+        out.append(cv2.LUT(img, luts[g]))
+    return out
+
+
+def _lut_batch(batch, lut):
+    """cv2.LUT over a whole batch, viewed as one tall image."""
+    tall = np.ascontiguousarray(batch).reshape((-1,) + batch.shape[2:])
+    return cv2.LUT(tall, lut).reshape(batch.shape)
+
+
+def contrast_stretching_batch(batch, smax, smin, rmin=None, rmax=None, per_image=True):
+    """contrast_stretching for a whole batch, returning float32 like the original.
+
+    With per_image=True each image is stretched with its own rmin/rmax (axis
+    reductions over H, W, C), giving the same result as contrast_stretching
+    per image.  per_image=False uses one range for the whole batch.  Explicit
+    rmin/rmax (scalars or one value per image) override the computed ones.
+    """
+    n = batch.shape[0]
+    if n == 0:
+        # Nothing to stretch (and no range to reduce over)
+        return np.empty(batch.shape, dtype='float32')
+
+    # Reduce on the input dtype: a uint8 batch is 4x less memory to scan than float32
+    pixels = np.ascontiguousarray(batch).reshape(n, -1)
+    if rmin is None:
+        rmin = pixels.min(axis=1) if per_image else pixels.min()
+    if rmax is None:
+        rmax = pixels.max(axis=1) if per_image else pixels.max()
+    rmin = _per_image(rmin, n, "rmin")
+    rmax = _per_image(rmax, n, "rmax")
+
+    # Flat images (rmax == rmin) come out smin-filled, as in contrast_stretching
+    flat = rmax == rmin
+    if flat.any():
+        print(f"[WARNING] {int(flat.sum())} image(s) with uniform intensity, returning smin-filled images.")
+    span = np.where(flat, 1.0, rmax - rmin)
+    scale = np.where(flat, 0.0, (smax - smin) / span)
+
+    # float32 parameters reproduce the per-image float32 arithmetic exactly
+    scale = scale.astype('float32')
+    offset = np.where(flat, 0.0, rmin).astype('float32')
+
+    if batch.dtype == np.uint8:
+        # One float32 table per image, tables[n, r] = (r - rmin) * scale + smin,
+        # then a single cv2.LUT pass per image.  cv2.LUT beats a NumPy gather
+        # (take_along_axis) here by about 3.5x.
+        tables = np.arange(256, dtype='float32') - offset[:, None]
+        tables *= scale[:, None]
+        tables += np.float32(smin)
+
+        if np.all(tables == tables[0]):
+            return _lut_batch(batch, tables[0])
+        out = np.empty(batch.shape, dtype='float32')
+        for i in range(n):
+            cv2.LUT(batch[i], tables[i], dst=out[i])
+        return out
+
+    # Float input: arithmetic, with the subtraction doing the float32 conversion
+    shape = (n,) + (1,) * (batch.ndim - 1)
+    img = np.subtract(batch, offset.reshape(shape), dtype='float32')
+    img *= scale.reshape(shape)
+    img += np.float32(smin)
+
+    return img
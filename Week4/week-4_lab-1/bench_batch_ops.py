@@ -0,0 +1,51 @@
+import time
+
+import numpy as np
+
+from batch_ops import (contrast_stretching_batch, gamma_correction_batch,
+                       gamma_correction_list, map_batched)
+from point_ops import contrast_stretching, gamma_correction
+
+
+def best_time(fn, repeats=3):
+    """Best wall-clock time of `repeats` calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Thousands of small thumbnails, as in the thumbnail workload
+rng = np.random.default_rng(0)
+N, H, W = 2000, 64, 64
+thumbs = [rng.integers(0, 256, (H, W, 3), dtype='uint8') for _ in range(N)]
+batch = np.stack(thumbs)
+gammas = rng.choice([0.4, 0.5, 1.0, 2.0, 2.5], N)
+
+# Correctness: batched results must equal the per-image functions
+out = gamma_correction_batch(1, gammas, batch)
+assert all(np.array_equal(out[i], gamma_correction(1, gammas[i], thumbs[i])) for i in range(N))
+out = contrast_stretching_batch(batch, smax=255, smin=0)
+assert all(np.array_equal(out[i], contrast_stretching(thumbs[i], smax=255, smin=0)) for i in range(N))
+
+results = [
+    ("gamma, per-image loop",        best_time(lambda: [gamma_correction(1, g, t) for g, t in zip(gammas, thumbs)])),
+    ("gamma, batch (one gamma)",     best_time(lambda: gamma_correction_batch(1, 0.5, batch))),
+    ("gamma, batch (per-image)",     best_time(lambda: gamma_correction_batch(1, gammas, batch))),
+    ("gamma, list (no stacking)",    best_time(lambda: gamma_correction_list(1, gammas, thumbs))),
+    ("stretch, per-image loop",      best_time(lambda: [contrast_stretching(t, smax=255, smin=0) for t in thumbs])),
+    ("stretch, batch (per-image)",   best_time(lambda: contrast_stretching_batch(batch, smax=255, smin=0))),
+    ("stretch, batch (shared)",      best_time(lambda: contrast_stretching_batch(batch, smax=255, smin=0, per_image=False))),
+    ("stretch, map_batched from list", best_time(lambda: map_batched(
+        thumbs, lambda b: contrast_stretching_batch(b, smax=255, smin=0)))),
+]
+
+loops = {"gamma": results[0][1], "stretch": results[4][1]}
+
+print(f"{N} thumbnails of {W}x{H}x3")
+for name, seconds in results:
+    loop = loops[name.split(",")[0]]
+    print(f"  {name:32s} {seconds * 1000:9.2f} ms   {N / seconds:10.0f} images/s   {loop / seconds:5.1f}x")
+print("Note: the pixel pass is memory-bound on thumbnails, so these gains stay well under 10x.")
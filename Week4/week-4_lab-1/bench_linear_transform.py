@@ -0,0 +1,58 @@
+import time
+
+import cv2
+import numpy as np
+
+from point_ops import linear_transform
+
+
+def loop_reference(image, alpha, beta):
+    """The per-pixel loop from 09-linear-brightness-and-contrast-adjustment.ipynb."""
+    new_image = np.zeros(image.shape, image.dtype)
+    for y in range(image.shape[0]):
+        for x in range(image.shape[1]):
+            for c in range(image.shape[2]):
+                new_image[y, x, c] = np.clip(alpha * image[y, x, c] + beta, 0, 255)
+    return new_image
+
+
+def best_time(fn, repeats=5):
+    """Best wall-clock time of `repeats` calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+alpha, beta = 1.7, 25
+
+image = cv2.imread("normaljpg.jpg")
+if image is None:
+    print("[WARNING] normaljpg.jpg not loaded, using random pixels instead.")
+    image = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype='uint8')
+
+# The loop is far too slow for the whole image, so time it on a small crop and
+# scale by pixel count.
+crop = image[:64, :64].copy()
+t_loop = best_time(lambda: loop_reference(crop, alpha, beta), repeats=1) * image.size / crop.size
+
+# Correctness: each variant must match its reference exactly
+assert np.array_equal(linear_transform(crop, alpha, beta, match="loop"), loop_reference(crop, alpha, beta))
+assert np.array_equal(linear_transform(image, alpha, beta), cv2.convertScaleAbs(image, alpha=alpha, beta=beta))
+
+work = image.copy()
+results = [
+    ("Python loop (extrapolated)",    t_loop),
+    ("cv2.convertScaleAbs",           best_time(lambda: cv2.convertScaleAbs(image, alpha=alpha, beta=beta))),
+    ("linear_transform (scalar, cv2)", best_time(lambda: linear_transform(image, alpha, beta))),
+    ("linear_transform (in-place)",   best_time(lambda: linear_transform(work, alpha, beta, out=work))),
+    ("linear_transform (loop, LUT)",  best_time(lambda: linear_transform(image, alpha, beta, match="loop"))),
+    ("linear_transform (loop, no LUT)", best_time(lambda: linear_transform(image, alpha, beta, match="loop", use_lut=False))),
+    ("linear_transform (per-channel)", best_time(lambda: linear_transform(image, [alpha, 1.0, 0.8], [beta, 0, -10]))),
+]
+
+print(f"Image: {image.shape[1]}x{image.shape[0]}x{image.shape[2]}, alpha={alpha}, beta={beta}")
+for name, seconds in results:
+    print(f"  {name:34s} {seconds * 1000:10.3f} ms   {t_loop / seconds:12.0f}x vs loop")
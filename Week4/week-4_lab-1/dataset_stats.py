@@ -0,0 +1,119 @@
+import json
+import os
+
+import numpy as np
+
+from histogram import channel_histograms
+from image_io import read_image
+
+
+def new_stats():
+    """Empty dataset statistics: merged histogram, global min/max, files seen.
+
+    "scale" is the decode reduction every file was added at; it is fixed when
+    the first image is added so all files weigh the same in the histogram.
+    """
+    return {"files": {}, "hist": None, "min": None, "max": None, "scale": None}
+
+
+def load_stats(filename):
+    """Load statistics saved by save_stats, or start fresh if the file doesn't exist."""
+    if not os.path.exists(filename):
+        return new_stats()
+
+    with open(filename) as f:
+        stats = json.load(f)
+    if stats["hist"] is not None:
+        stats["hist"] = np.asarray(stats["hist"], dtype='int64')
+    return stats
+
+
+def save_stats(stats, filename):
+    data = dict(stats)
+    if data["hist"] is not None:
+        data["hist"] = data["hist"].tolist()
+    with open(filename, "w") as f:
+        json.dump(data, f)
+
+
+def _check_scale(stats, scale):
+    if stats["scale"] is not None and stats["scale"] != scale:
+        raise ValueError(f"statistics were collected at scale={stats['scale']}, "
+                         f"can't add files decoded at scale={scale}")
+
+
+def add_image(stats, image, key, scale=1):
+    """Fold one image, decoded at `scale`, into the running statistics.
+
+    Only the image's histogram (all channels merged, like contrast_stretching's
+    single rmin/rmax) is kept, so the reduction is a cheap element-wise sum.
+    """
+    _check_scale(stats, scale)
+    hist = channel_histograms(image).sum(axis=0)
+    nonzero = np.flatnonzero(hist)
+    lo, hi = int(nonzero[0]), int(nonzero[-1])
+
+    if stats["hist"] is None:
+        stats["hist"] = hist
+    elif stats["hist"].size != hist.size:
+        raise ValueError(f"{key}: {image.dtype} image doesn't match the dataset's bit depth")
+    else:
+        stats["hist"] += hist
+
+    stats["min"] = lo if stats["min"] is None else min(stats["min"], lo)
+    stats["max"] = hi if stats["max"] is None else max(stats["max"], hi)
+    stats["files"][key] = {"min": lo, "max": hi}
+    stats["scale"] = scale
+
+
+def update_stats(stats, paths, scale=1, root="."):
+    """Add every path not seen before; files already in `stats` are not re-read.
+
+    scale > 1 decodes reduced-resolution previews (see image_io.read_image).
+    Downscaling averages away isolated extreme pixels, so prefer percentile
+    ranges over min/max when using it.  A reduced file contributes fewer
+    pixels to the histogram, so every call on the same statistics must use
+    the same scale.
+
+    Files are recorded by their path relative to `root` (the directory of the
+    stats file), so the dataset folder can be moved without a rescan.
+    Returns the list of newly added paths.
+    """
+    _check_scale(stats, scale)
+
+    added = []
+    for path in paths:
+        key = os.path.relpath(path, root).replace(os.sep, "/")
+        if key in stats["files"]:
+            continue
+
+        image = read_image(path, scale)
+        if image is None:
+            print(f"[WARNING] {path}: not loaded, skipping.")
+            continue
+
+        add_image(stats, image, key, scale)
+        added.append(path)
+
+    return added
+
+
+def stretch_range(stats, low=None, high=None):
+    """Shared (rmin, rmax) for contrast_stretching.
+
+    With no percentiles this is the dataset's global min/max.  low/high (in
+    percent, e.g. 0.5 and 99.5) read robust limits from the merged histogram
+    instead, ignoring a few outlier pixels.
+    """
+    if stats["hist"] is None:
+        raise ValueError("no images have been added to the dataset statistics")
+
+    cumulative = np.cumsum(stats["hist"])
+    total = cumulative[-1]
+    rmin, rmax = stats["min"], stats["max"]
+    if low is not None:
+        rmin = max(rmin, int(np.searchsorted(cumulative, total * low / 100)))
+    if high is not None:
+        rmax = min(rmax, int(np.searchsorted(cumulative, total * high / 100)))
+
+    return rmin, rmax
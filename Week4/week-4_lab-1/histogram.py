@@ -0,0 +1,111 @@
+import csv
+import json
+import os
+
+import cv2
+import numpy as np
+
+
+# cv2.calcHist counts in float32, which is only exact up to 2**24 per bin
+CALCHIST_MAX_PIXELS = 2 ** 24
+
+
+def channel_names(image):
+    """Names used in reports: gray, b/g/r or b/g/r/a."""
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    if channels == 1:
+        return ["gray"]
+    if channels <= 4:
+        return ["b", "g", "r", "a"][:channels]
+    return [f"c{i}" for i in range(channels)]
+
+
+def channel_histograms(image):
+    """Per-channel histograms of a uint8 or uint16 image.
+
+    Returns an int64 array of shape (C, 256) for uint8 or (C, 65536) for
+    uint16, one row per channel (C = 1 for grayscale).  uint8 goes through
+    cv2.calcHist, which reads the interleaved channels in place; uint16 (and
+    very large uint8 images) through np.bincount.
+    """
+    if image.dtype == np.uint8:
+        levels = 256
+    elif image.dtype == np.uint16:
+        levels = 65536
+    else:
+        raise ValueError(f"histograms need a uint8 or uint16 image, got {image.dtype}")
+
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    pixels = image.shape[0] * image.shape[1]
+    hists = np.empty((channels, levels), dtype='int64')
+
+    for c in range(channels):
+        if levels == 256 and pixels <= CALCHIST_MAX_PIXELS:
+            hist = cv2.calcHist([image], [c], None, [256], [0, 256])
+            hists[c] = hist.reshape(-1)
+        else:
+            plane = image if image.ndim == 2 else image[..., c]
+            hists[c] = np.bincount(plane.reshape(-1), minlength=levels)
+
+    return hists
+
+
+def histogram_stats(hist, percentiles=(1, 5, 50, 95, 99)):
+    """Summary statistics of one channel, computed from its histogram only.
+
+    clipped_low / clipped_high are the fractions of pixels sitting at the
+    lowest / highest representable value (0 and 255 for uint8).
+    """
+    hist = np.asarray(hist, dtype='int64')
+    count = int(hist.sum())
+    if count == 0:
+        raise ValueError("histogram is empty")
+
+    levels = np.arange(hist.size, dtype='float64')
+    mean = float((levels * hist).sum() / count)
+    var = float((((levels - mean) ** 2) * hist).sum() / count)
+    nonzero = np.flatnonzero(hist)
+
+    # Percentile p is the first level whose cumulative count reaches p% of the
+    # pixels, and at least one pixel (so p0 is the min, not level 0)
+    cumulative = np.cumsum(hist)
+    stats = {
+        "count": count,
+        "mean": round(mean, 4),
+        "std": round(var ** 0.5, 4),
+        "min": int(nonzero[0]),
+        "max": int(nonzero[-1]),
+    }
+    for p in percentiles:
+        stats[f"p{p:g}"] = int(np.searchsorted(cumulative, max(count * p / 100, 1)))
+    stats["clipped_low"] = round(float(hist[0] / count), 6)
+    stats["clipped_high"] = round(float(hist[-1] / count), 6)
+
+    return stats
+
+
+def histogram_report(image, filename, percentiles=(1, 5, 50, 95, 99)):
+    """Write per-channel histogram statistics of `image` to a .json or .csv file.
+
+    Returns the report as a dict of channel name → stats.
+    """
+    hists = channel_histograms(image)
+    report = {name: histogram_stats(h, percentiles)
+              for name, h in zip(channel_names(image), hists)}
+
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".json":
+        with open(filename, "w") as f:
+            json.dump({"shape": list(image.shape), "dtype": str(image.dtype),
+                       "channels": report}, f)
+    elif ext == ".csv":
+        fields = ["channel"] + list(next(iter(report.values())))
+        with open(filename, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for name, stats in report.items():
+                writer.writerow({"channel": name, **stats})
+    else:
+        raise ValueError(f"report must be .json or .csv, got {filename!r}")
+
+    return report
@@ -0,0 +1,33 @@
+import cv2
+
+
+# imread flags per reduction factor.  For JPEGs the decoder itself skips the
+# work (DCT scaling), so a 1/4 preview costs a fraction of a full decode.
+REDUCED_COLOR = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+REDUCED_GRAYSCALE = {
+    1: cv2.IMREAD_GRAYSCALE,
+    2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
+
+def read_image(path, scale=1, gray=False):
+    """Read an image, optionally decoded at 1/2, 1/4 or 1/8 resolution.
+
+    scale=1 is a normal full-resolution cv2.imread.  Larger scales are meant
+    for previews and parameter tuning; apply the tuned parameters to the
+    full-resolution image afterwards.  Returns None if the file can't be read,
+    just like cv2.imread.
+    """
+    flags = REDUCED_GRAYSCALE if gray else REDUCED_COLOR
+    if scale not in flags:
+        raise ValueError(f"scale must be one of {sorted(flags)}, got {scale}")
+
+    return cv2.imread(path, flags[scale])
@@ -0,0 +1,204 @@
+import cv2
+import numpy as np
+
+
+# Luminance modes: cvtColor codes to and from a space whose channel 0 is the
+# brightness plane (Y for YCrCb, L for Lab).  "bgr" processes all channels.
+LUMA_SPACES = {
+    "ycrcb": (cv2.COLOR_BGR2YCrCb, cv2.COLOR_YCrCb2BGR),
+    "lab":   (cv2.COLOR_BGR2Lab,   cv2.COLOR_Lab2BGR),
+}
+
+
+def _check_mode(mode):
+    if mode != "bgr" and mode not in LUMA_SPACES:
+        raise ValueError(f"mode must be 'bgr' or one of {sorted(LUMA_SPACES)}, got {mode!r}")
+
+
+def _on_luminance(image, mode, fn):
+    """Apply fn to the Y/L plane of a uint8 BGR image only and convert back.
+
+    Chroma is untouched, so hue is preserved.  This is not a speed-up: the two
+    cvtColor calls cost more than correcting all three channels with one
+    cv2.LUT.  On a 3000x2000 gamma correction, ycrcb is about 2-3x and lab
+    about 10x slower than bgr.
+    """
+    if image.dtype != np.uint8:
+        raise ValueError("luminance modes need a uint8 image")
+    if image.shape[2] != 3:
+        raise ValueError(f"luminance modes need a 3-channel BGR image, got {image.shape[2]} channels")
+
+    to_space, to_bgr = LUMA_SPACES[mode]
+    converted = cv2.cvtColor(image, to_space)
+    plane = cv2.extractChannel(converted, 0)
+    cv2.insertChannel(fn(plane), converted, 0)
+
+    return cv2.cvtColor(converted, to_bgr)
+
+
+def _gamma_float(c, gamma, I_in):
+
+    # Step 1 – normalize to [0, 1]
+    I_norm = I_in.astype('float32') / 255
+
+    # Step 2 – apply power law:  T(r) = c * r^gamma
+    I_transformed = c * (I_norm ** gamma)
+
+    # Step 3 – clip to [0, 1] in case c > 1 pushes values above 1
+    I_transformed = np.clip(I_transformed, 0, 1)
+
+    # Step 4 – convert back to uint8 for display / saving
+    I_out = (I_transformed * 255).astype('uint8')
+
+    return I_out
+
+
+def gamma_lut(c, gamma):
+    """256-entry table with exactly the values gamma_correction computes."""
+    return _gamma_float(c, gamma, np.arange(256, dtype='uint8'))
+
+
+def gamma_correction(c, gamma, I_in, mode="bgr"):
+    """Power-law transform T(r) = c * r^gamma on [0, 1]-normalized intensities.
+
+    uint8 images go through a lookup table instead of per-pixel float math.
+    mode="ycrcb" or "lab" corrects only the luminance plane of a BGR image,
+    which keeps hue but is slower than "bgr" (see _on_luminance); grayscale
+    input (e.g. read_image(path, gray=True)) has only that plane.
+    """
+    _check_mode(mode)
+    if mode != "bgr" and I_in.ndim == 3:
+        lut = gamma_lut(c, gamma)
+        return _on_luminance(I_in, mode, lambda plane: cv2.LUT(plane, lut))
+
+    if I_in.dtype == np.uint8:
+        return cv2.LUT(I_in, gamma_lut(c, gamma))
+
+    return _gamma_float(c, gamma, I_in)
+
+
+def contrast_stretching(i_in, smax, smin, rmin=None, rmax=None, mode="bgr"):
+
+    # Luminance modes stretch only the Y/L plane (rmin/rmax then refer to it);
+    # the result goes back through uint8, so smin/smax must lie in [0, 255]
+    _check_mode(mode)
+    if mode != "bgr" and i_in.ndim == 3:
+        if not (0 <= smin <= 255 and 0 <= smax <= 255):
+            raise ValueError(f"luminance modes need smin/smax in [0, 255], got smin={smin}, smax={smax}")
+
+        def stretch_plane(plane):
+            stretched = contrast_stretching(plane, smax, smin, rmin, rmax)
+            return np.clip(stretched, 0, 255).astype('uint8')
+        return _on_luminance(i_in, mode, stretch_plane).astype('float32')
+
+    img = i_in.astype('float32')
+
+    # rmin/rmax default to this image's own range; pass shared values (e.g.
+    # from dataset_stats.stretch_range) to give a whole dataset one tone curve
+    rmin = float(img.min()) if rmin is None else float(rmin)
+    rmax = float(img.max()) if rmax is None else float(rmax)
+
+    # Avoid division by zero when image is completely flat
+    if rmax == rmin:
+        print("[WARNING] rmax == rmin: image has uniform intensity, returning smin-filled image.")
+        return np.full_like(img, smin, dtype='float32')
+
+    # Apply formula: s = ((smax - smin) / (rmax - rmin)) * (r - rmin) + smin
+    stretched = ((smax - smin) / (rmax - rmin)) * (img - rmin) + smin
+
+    return stretched.astype('float32')
+
+
+def _saturate(values, match):
+    """Map float values to uint8 with either cv2 or nested-loop semantics."""
+    if match == "cv2":
+        # cv2.convertScaleAbs: |x|, round half to even, saturate
+        values = np.rint(np.abs(values))
+    elif match == "loop":
+        # new_image[y,x,c] = np.clip(alpha*image[y,x,c] + beta, 0, 255) on a
+        # uint8 array: clip, then the assignment truncates toward zero
+        pass
+    else:
+        raise ValueError(f"match must be 'cv2' or 'loop', got {match!r}")
+
+    return np.clip(values, 0, 255).astype('uint8')
+
+
+def _fma_float32(values, alpha, beta):
+    """alpha * values + beta the way convertScaleAbs computes it.
+
+    OpenCV's SIMD kernel uses a float32 fused multiply-add, i.e. a single
+    rounding to float32.  The float64 multiply-add of float32 operands is
+    exact for 8/16-bit inputs, so casting it to float32 reproduces that.
+    """
+    alpha = np.asarray(alpha, dtype='float32').astype('float64')
+    beta  = np.asarray(beta,  dtype='float32').astype('float64')
+    return (values * alpha + beta).astype('float32')
+
+
+def linear_lut(alpha, beta, match="cv2"):
+    """Build the uint8 lookup table for s = alpha * r + beta.
+
+    alpha and beta are scalars or per-channel sequences.  The result has shape
+    (256, 1, C) with C = 1 for scalars, which is what cv2.LUT expects.
+    """
+    alpha = np.atleast_1d(np.asarray(alpha, dtype='float64'))
+    beta  = np.atleast_1d(np.asarray(beta,  dtype='float64'))
+    if alpha.ndim > 1 or beta.ndim > 1:
+        raise ValueError("alpha and beta must be scalars or 1-D per-channel sequences")
+
+    r = np.arange(256, dtype='float64')[:, None]
+    if match == "cv2":
+        values = _fma_float32(r, alpha, beta)
+    else:
+        values = r * alpha + beta
+
+    return _saturate(values, match)[:, None, :]
+
+
+def linear_transform(image, alpha=1.0, beta=0.0, match="cv2", use_lut=True, out=None):
+    """Saturating linear point operation: out = uint8(alpha * image + beta).
+
+    match="cv2" gives the same result as cv2.convertScaleAbs (absolute value,
+    round to nearest); match="loop" gives the same result as the nested
+    np.clip loop in 09-linear-brightness-and-contrast-adjustment.ipynb
+    (negative values clip to 0, fractions are truncated).
+
+    Scalar alpha/beta with match="cv2" simply call cv2.convertScaleAbs, which
+    is the fastest path.  alpha/beta may also be per-channel sequences of
+    length image.shape[-1]; those, and match="loop", go through a 256-entry
+    table and cv2.LUT for uint8 input unless use_lut=False.
+    Pass out=image to transform in place.
+    """
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    for name, value in (("alpha", alpha), ("beta", beta)):
+        size = np.size(value)
+        if size != 1 and size != channels:
+            raise ValueError(f"{name} has {size} values but the image has {channels} channel(s)")
+
+    if out is None:
+        out = np.empty(image.shape, dtype='uint8')
+    elif out.shape != image.shape or out.dtype != np.uint8:
+        raise ValueError("out must be a uint8 array with the same shape as image")
+
+    # cv2 can only write into contiguous arrays; compute into a temporary
+    # and copy when out is a strided view
+    dst = out if out.flags.c_contiguous else np.empty(image.shape, dtype='uint8')
+
+    if match == "cv2" and np.size(alpha) == 1 and np.size(beta) == 1:
+        cv2.convertScaleAbs(image, dst=dst, alpha=float(np.ravel(alpha)[0]), beta=float(np.ravel(beta)[0]))
+    elif use_lut and image.dtype == np.uint8:
+        cv2.LUT(image, linear_lut(alpha, beta, match), dst=dst)
+    else:
+        # Direct path for non-uint8 input or when the table isn't wanted
+        values = image.astype('float64')
+        if match == "cv2":
+            values = _fma_float32(values, alpha, beta)
+        else:
+            values *= np.asarray(alpha, dtype='float64')
+            values += np.asarray(beta, dtype='float64')
+        dst[...] = _saturate(values, match)
+
+    if dst is not out:
+        out[...] = dst
+    return out
@@ -1,30 +1,28 @@
 import cv2
-import numpy as np
 import matplotlib.pyplot as plt
 
+from histogram import histogram_report
+from image_io import read_image
+from point_ops import gamma_correction
 
-def gamma_correction(c, gamma, I_in):
-    
-    # Step 1 – normalize to [0, 1]
-    I_norm = I_in.astype('float32') / 255
+# 1 = decode at full resolution.  2, 4 or 8 decode a reduced preview so gamma
+# tuning is fast; the chosen gammas are applied to the full-size images at the end.
+PREVIEW_SCALE = 1
 
-    # Step 2 – apply power law:  T(r) = c * r^gamma
-    I_transformed = c * (I_norm ** gamma)
+# "bgr" corrects all three channels (fastest), "ycrcb"/"lab" only the
+# luminance plane (preserves hue, but the colour conversions make it slower),
+# "gray" decodes straight to grayscale.
+MODE = "bgr"
+GRAY = MODE == "gray"
 
-    # Step 3 – clip to [0, 1] in case c > 1 pushes values above 1
-    I_transformed = np.clip(I_transformed, 0, 1)
 
-    # Step 4 – convert back to uint8 for display / saving
-    I_out = (I_transformed * 255).astype('uint8')
+paths = ["dark.jpg",          # dark image  → needs gamma < 1  (e.g. 0.4) to brighten
+         "light.jpg",         # bright image → needs gamma > 1  (e.g. 2.5) to darken
+         "lowjpg.jpg",        # low-contrast → try gamma ~ 0.5
+         "overexposed.jpg",   # overexposed  → try gamma ~ 2.0
+         "normaljpg.jpg"]     # normal image → try gamma = 1.0 (no change)
 
-    return I_out
-
-
-img1 = cv2.imread("dark.jpg")   # dark image  → needs gamma < 1  (e.g. 0.4) to brighten
-img2 = cv2.imread("light.jpg")   # bright image → needs gamma > 1  (e.g. 2.5) to darken
-img3 = cv2.imread("lowjpg.jpg")   # low-contrast → try gamma ~ 0.5
-img4 = cv2.imread("overexposed.jpg")   # overexposed  → try gamma ~ 2.0
-img5 = cv2.imread("normaljpg.jpg")   # normal image → try gamma = 1.0 (no change)
+img1, img2, img3, img4, img5 = [read_image(p, PREVIEW_SCALE, gray=GRAY) for p in paths]
 
 images = [img1, img2, img3, img4, img5]
 titles = ["Image 1", "Image 2", "Image 3", "Image 4", "Image 5"]
@@ -39,11 +37,12 @@ for i, (img, gamma, title) in enumerate(zip(images, gammas, titles)):
         print(f"[WARNING] {title}: image not loaded, skipping.")
         continue
 
-    output = gamma_correction(c, gamma, img)
+    output = gamma_correction(c, gamma, img, mode="bgr" if GRAY else MODE)
 
-    # Convert BGR → RGB for matplotlib display
-    img_rgb    = cv2.cvtColor(img,    cv2.COLOR_BGR2RGB)
-    output_rgb = cv2.cvtColor(output, cv2.COLOR_BGR2RGB)
+    # Convert BGR (or gray) → RGB for matplotlib display
+    to_rgb     = cv2.COLOR_GRAY2RGB if GRAY else cv2.COLOR_BGR2RGB
+    img_rgb    = cv2.cvtColor(img,    to_rgb)
+    output_rgb = cv2.cvtColor(output, to_rgb)
 
     fig, axes = plt.subplots(1, 2, figsize=(10, 4))
     axes[0].imshow(img_rgb);    axes[0].set_title(f"{title} – Original");       axes[0].axis('off')
@@ -57,6 +56,12 @@ for i, (img, gamma, title) in enumerate(zip(images, gammas, titles)):
     plt.savefig(f"task1_output_image{i+1}.png", dpi=150)
     plt.show()
 
+    # Quick check that the correction moved the intensities the expected way
+    before = histogram_report(img,    f"task1_output_image{i+1}_before.json")
+    after  = histogram_report(output, f"task1_output_image{i+1}_after.json")
+    print(f"{title}: mean intensity ({'/'.join(before)}) "
+          f"{[before[ch]['mean'] for ch in before]} → {[after[ch]['mean'] for ch in after]}")
+
     print(f"{title}: γ={gamma} chosen because ", end="")
     if gamma < 1:
         print("the image is dark/underexposed – γ<1 expands low intensities.")
@@ -66,8 +71,11 @@ for i, (img, gamma, title) in enumerate(zip(images, gammas, titles)):
         print("γ=1 leaves the image unchanged (baseline test).")
 
 
-if img1 is not None:
-    I_norm = img1.astype('float32') / 255
+# Task 1-3 writes committed full-size artifacts, so never use the reduced preview here
+img1_full = img1 if PREVIEW_SCALE == 1 else read_image(paths[0], gray=GRAY)
+
+if img1_full is not None:
+    I_norm = img1_full.astype('float32') / 255
 
     # --- PROBLEM: saving float32 directly ---
     cv2.imwrite("task1_normalized_BROKEN.png", I_norm)
@@ -80,3 +88,16 @@ if img1 is not None:
     print("\nTask 1-3: Saved fixed normalized image as 'task1_normalized_FIXED.png'")
     print("Problem : cv2.imwrite treats float32 values as 0–255, so [0,1] → near-black.")
     print("Fix     : multiply by 255 and cast to uint8 before calling imwrite.")
+
+
+# Preview mode: the gammas were tuned on reduced decodes, now apply them once
+# to the full-resolution images.
+if PREVIEW_SCALE > 1:
+    for i, (path, gamma) in enumerate(zip(paths, gammas)):
+        full = read_image(path, gray=GRAY)
+        if full is None:
+            continue
+        output = gamma_correction(c, gamma, full, mode="bgr" if GRAY else MODE)
+        cv2.imwrite(f"task1_full_image{i+1}.png", output)
+        histogram_report(output, f"task1_full_image{i+1}.json")
+        print(f"Saved full-resolution result: task1_full_image{i+1}.png (γ={gamma})")
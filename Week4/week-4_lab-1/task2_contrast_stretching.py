@@ -2,22 +2,15 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 
-def contrast_stretching(i_in, smax, smin):
-    
-    img = i_in.astype('float32')
-
-    rmin = float(img.min())
-    rmax = float(img.max())
-
-    # Avoid division by zero when image is completely flat
-    if rmax == rmin:
-        print("[WARNING] rmax == rmin: image has uniform intensity, returning smin-filled image.")
-        return np.full_like(img, smin, dtype='float32')
-
-    # Apply formula: s = ((smax - smin) / (rmax - rmin)) * (r - rmin) + smin
-    stretched = ((smax - smin) / (rmax - rmin)) * (img - rmin) + smin
+from histogram import histogram_report
+from image_io import read_image
+from point_ops import contrast_stretching
 
-    return stretched.astype('float32')
+# 1 = decode at full resolution.  2, 4 or 8 decode a reduced preview so the
+# smax/smin combinations can be compared quickly; FINAL_SMAX/FINAL_SMIN are
+# applied to the full-size images at the end.
+PREVIEW_SCALE = 1
+FINAL_SMAX, FINAL_SMIN = 0, 255
 
 
 def show_and_save(original, result, title, filename, smax, smin, normalized=False):
@@ -50,13 +43,16 @@ def show_and_save(original, result, title, filename, smax, smin, normalized=Fals
     plt.tight_layout()
     plt.savefig(filename, dpi=150)
     plt.show()
-    print(f"Saved: {filename}")
+
+    # Histogram report of the stretched result, on the 0-255 scale
+    result_uint8 = np.clip(result * 255 if normalized else result, 0, 255).astype('uint8')
+    report = histogram_report(result_uint8, filename.rsplit('.', 1)[0] + ".json")
+    print(f"Saved: {filename}  (output range per channel: "
+          f"{[(report[ch]['min'], report[ch]['max']) for ch in report]})")
     
-img1 = cv2.imread("dark.jpg")   # dark image  → needs gamma < 1  (e.g. 0.4) to brighten
-img2 = cv2.imread("light.jpg")   # bright image → needs gamma > 1  (e.g. 2.5) to darken
-img3 = cv2.imread("lowjpg.jpg")   # low-contrast → try gamma ~ 0.5
-img4 = cv2.imread("overexposed.jpg")   # overexposed  → try gamma ~ 2.0
-img5 = cv2.imread("normaljpg.jpg") 
+paths = ["dark.jpg", "light.jpg", "lowjpg.jpg", "overexposed.jpg", "normaljpg.jpg"]
+
+img1, img2, img3, img4, img5 = [read_image(p, PREVIEW_SCALE) for p in paths]
 
 images = [img1, img2, img3, img4, img5]
 names  = ["img1", "img2", "img3", "img4", "img5"]
@@ -169,3 +165,19 @@ Summary of observations for Task 2-4:
   (smax=50,  smin=200) : Moderate stretch – reasonable contrast improvement
                           without pushing extremes.
 """)
+
+
+# Preview mode: apply the chosen stretch once to the full-resolution images.
+# rmin/rmax are recomputed from the full image, since downscaling can soften
+# the extreme pixel values.
+if PREVIEW_SCALE > 1:
+    for path, name in zip(paths, names):
+        full = read_image(path)
+        if full is None:
+            continue
+        result = contrast_stretching(full, smax=FINAL_SMAX, smin=FINAL_SMIN)
+        filename = f"task2_full_{name}_smax{FINAL_SMAX}_smin{FINAL_SMIN}.png"
+        result_uint8 = np.clip(result, 0, 255).astype('uint8')
+        cv2.imwrite(filename, result_uint8)
+        histogram_report(result_uint8, filename.rsplit('.', 1)[0] + ".json")
+        print(f"Saved full-resolution result: {filename}")
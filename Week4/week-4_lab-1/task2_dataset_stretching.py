@@ -0,0 +1,57 @@
+import glob
+import os
+
+import cv2
+import numpy as np
+
+from dataset_stats import load_stats, save_stats, stretch_range, update_stats
+from histogram import histogram_report
+from image_io import read_image
+from point_ops import contrast_stretching
+
+# Statistics persist between runs: new files are folded in, old ones aren't re-read
+STATS_FILE = "dataset_stats.json"
+STATS_SCALE = 4           # decode at 1/4 resolution for the statistics pass
+LOW, HIGH = 0.5, 99.5     # percentiles used as the shared rmin / rmax
+SMAX, SMIN = 255, 0
+
+
+# ─────────────────────────────────────────────
+#  Task 2-5 : One tone curve for the whole dataset
+# ─────────────────────────────────────────────
+
+print("=" * 60)
+print("Task 2-5 : Dataset-wide contrast stretching")
+print("=" * 60)
+
+paths = sorted(glob.glob("*.jpg"))
+
+stats = load_stats(STATS_FILE)
+added = update_stats(stats, paths, scale=STATS_SCALE,
+                     root=os.path.dirname(os.path.abspath(STATS_FILE)))
+save_stats(stats, STATS_FILE)
+print(f"Statistics: {len(added)} new file(s), {len(stats['files'])} total in {STATS_FILE}")
+
+rmin, rmax = stretch_range(stats, LOW, HIGH)
+print(f"Shared range: rmin={rmin}, rmax={rmax}  (p{LOW:g} / p{HIGH:g}; "
+      f"global min/max = {stats['min']}/{stats['max']})")
+
+for path in paths:
+    img = read_image(path)
+    if img is None:
+        continue
+
+    result = contrast_stretching(img, smax=SMAX, smin=SMIN, rmin=rmin, rmax=rmax)
+    result_uint8 = np.clip(result, 0, 255).astype('uint8')
+
+    name = path.rsplit('.', 1)[0]
+    filename = f"task2_5_{name}_dataset.png"
+    cv2.imwrite(filename, result_uint8)
+    histogram_report(result_uint8, f"task2_5_{name}_dataset.json")
+    print(f"Saved: {filename}")
+
+print("""
+Observation: every frame is mapped with the same rmin/rmax, so a frame that
+is darker than the rest stays darker instead of being stretched to full range
+on its own.  That keeps time-lapses flicker-free and training data consistent.
+""")